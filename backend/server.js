@@ -9,13 +9,15 @@ const execAsync = promisify(exec);
 const execFileAsync = promisify(execFile);
 
 const {
-  getNcrewHomeDir,
   getProjectsDir,
+  getTemplatesDir,
+  getStagePromptsDir,
   getModelsCacheFile,
   getTaskLogsDir
 } = require('./utils/paths');
 const { initNcrewStructure } = require('./utils/init');
 const { migrateOldSettings } = require('./utils/migrate');
+const { readFileCached, readJsonCached, invalidateCachedFile } = require('./utils/fileCache');
 
 const app = express();
 const DEFAULT_PORT = 3001;
@@ -23,13 +25,23 @@ const envPortRaw = process.env.PORT ?? process.env.NCREW_BACKEND_PORT ?? process
 const envPort = Number(envPortRaw);
 const PORT = Number.isInteger(envPort) && envPort > 0 ? envPort : DEFAULT_PORT;
 const SETTINGS_DIR = getProjectsDir();
+const TEMPLATES_DIR = getTemplatesDir();
+const STAGE_PROMPTS_DIR = getStagePromptsDir();
 const MODELS_CACHE_FILE = getModelsCacheFile();
 const CACHE_TTL = 24 * 60 * 60 * 1000;
+const JSON_BODY_LIMIT = '64kb';
 const RUNNING_TASKS = new Map();
+const HISTORY_WRITE_QUEUES = new Map();
+let atomicWriteCounter = 0;
 const STAGES = ['Specification', 'Plan', 'Implementation', 'Verification'];
+const PROJECT_ID_WHITESPACE_RE = /\s+/g;
+const UNSAFE_BRANCH_CHARS_RE = /[^a-zA-Z0-9._-]/g;
+const DIGITS_RE = /^\d+$/;
+const FRONTMATTER_RE = /^---\n([\s\S]*?)\n---/;
+const SURROUNDING_QUOTES_RE = /^"|"$/g;
 
 app.use(cors());
-app.use(express.json());
+app.use(express.json({ limit: JSON_BODY_LIMIT }));
 app.use(express.static(path.join(__dirname, '../frontend/dist')));
 
 function getTaskKey(projectId, taskId) {
@@ -58,7 +70,7 @@ function toPosixPath(filePath) {
 }
 
 async function ensureWorktreeTemplateFile(worktreePath, templateFileName) {
-  const source = path.join(getNcrewHomeDir(), 'templates', templateFileName);
+  const source = path.join(TEMPLATES_DIR, templateFileName);
   const targetDir = path.join(worktreePath, '.ncrew', 'templates');
   const target = path.join(targetDir, templateFileName);
   await fs.ensureDir(targetDir);
@@ -72,22 +84,21 @@ async function ensureWorktreeTemplateFile(worktreePath, templateFileName) {
   return path.posix.join('.ncrew', 'templates', templateFileName);
 }
 
+function getTemplatePathVariants(templateFileName) {
+  const absolutePath = path.join(TEMPLATES_DIR, templateFileName);
+  return [`~/.ncrew/templates/${templateFileName}`, absolutePath, toPosixPath(absolutePath)];
+}
+
+const TEMPLATE_PATH_MAPPINGS = [
+  { key: 'spec_template', variants: getTemplatePathVariants('spec.md') },
+  { key: 'plan_template', variants: getTemplatePathVariants('plan.md') }
+];
+
 function rewriteNcrewTemplatePathsInPrompt(prompt, replacements) {
   let result = String(prompt || '');
 
-  const ncrewHome = getNcrewHomeDir();
-  const mappings = [
-    {
-      variants: ['~/.ncrew/templates/spec.md', path.join(ncrewHome, 'templates', 'spec.md'), toPosixPath(path.join(ncrewHome, 'templates', 'spec.md'))],
-      replacement: replacements.spec_template
-    },
-    {
-      variants: ['~/.ncrew/templates/plan.md', path.join(ncrewHome, 'templates', 'plan.md'), toPosixPath(path.join(ncrewHome, 'templates', 'plan.md'))],
-      replacement: replacements.plan_template
-    }
-  ];
-
-  for (const { variants, replacement } of mappings) {
+  for (const { key, variants } of TEMPLATE_PATH_MAPPINGS) {
+    const replacement = replacements[key];
     if (!replacement) continue;
     for (const variant of variants) {
       if (!variant) continue;
@@ -218,7 +229,7 @@ async function doesGitBranchExist(projectPath, branchName) {
 
 async function createWorktree(projectPath, taskId, worktreePrefix) {
   const safePrefix = String(worktreePrefix || 'task-');
-  const safeTaskId = String(taskId || '').replace(/[^a-zA-Z0-9._-]/g, '-');
+  const safeTaskId = String(taskId || '').replace(UNSAFE_BRANCH_CHARS_RE, '-');
   const branchName = `${safePrefix}${safeTaskId}`;
   const worktreesDir = path.join(projectPath, 'worktrees');
   const worktreePath = path.join(worktreesDir, branchName);
@@ -248,7 +259,7 @@ async function createWorktree(projectPath, taskId, worktreePrefix) {
 
 async function getStagePrompt(stage) {
   const stageName = String(stage || 'Specification').toLowerCase();
-  const promptPath = path.join(getNcrewHomeDir(), 'stage_prompts', `${stageName}.md`);
+  const promptPath = path.join(STAGE_PROMPTS_DIR, `${stageName}.md`);
 
   try {
     if (await fs.pathExists(promptPath)) {
@@ -265,8 +276,7 @@ function replaceVariables(prompt, variables) {
   let result = prompt;
 
   for (const [key, value] of Object.entries(variables)) {
-    const regex = new RegExp(`\\{${key}\\}`, 'g');
-    result = result.replace(regex, value);
+    result = replaceAllLiteral(result, `{${key}}`, value);
   }
 
   return result;
@@ -284,7 +294,7 @@ async function getModels(forceRefresh = false) {
   return await saveCachedModels(models);
 }
 
-async function readTaskHistory(tasksDir, taskId) {
+async function readTaskHistory(tasksDir, taskId, { cached = false } = {}) {
   const historyFile = path.join(tasksDir, `${taskId}-history.json`);
 
   try {
@@ -292,7 +302,7 @@ async function readTaskHistory(tasksDir, taskId) {
       return { history: [] };
     }
 
-    const data = await fs.readJson(historyFile);
+    const data = cached ? await readJsonCached(historyFile) : await fs.readJson(historyFile);
     if (!data || !Array.isArray(data.history)) {
       return { history: [] };
     }
@@ -304,43 +314,92 @@ async function readTaskHistory(tasksDir, taskId) {
   }
 }
 
+// Writes to a temp file, flushes it and renames it over the target, so
+// readers never observe a partially written file.
+async function writeJsonAtomic(filePath, data) {
+  const tempFile = `${filePath}.${process.pid}-${++atomicWriteCounter}.tmp`;
+  try {
+    const fd = await fs.open(tempFile, 'w');
+    try {
+      await fs.writeFile(fd, `${JSON.stringify(data, null, 2)}\n`, 'utf-8');
+      await fs.fdatasync(fd);
+    } finally {
+      await fs.close(fd);
+    }
+    await fs.rename(tempFile, filePath);
+  } catch (error) {
+    await fs.remove(tempFile).catch(() => {});
+    throw error;
+  }
+}
+
+// Serializes read-modify-write cycles on the same history file, so that
+// concurrent updates (e.g. stop + process close) do not drop each other.
+function withHistoryWriteLock(historyFile, fn) {
+  const previous = HISTORY_WRITE_QUEUES.get(historyFile) || Promise.resolve();
+  const result = previous.then(fn);
+  const queued = result.catch(() => {});
+  HISTORY_WRITE_QUEUES.set(historyFile, queued);
+  queued.then(() => {
+    if (HISTORY_WRITE_QUEUES.get(historyFile) === queued) {
+      HISTORY_WRITE_QUEUES.delete(historyFile);
+    }
+  });
+  return result;
+}
+
 async function appendHistoryEntry(tasksDir, taskId, entry) {
   const historyFile = path.join(tasksDir, `${taskId}-history.json`);
-  const current = await readTaskHistory(tasksDir, taskId);
-  current.history.push(entry);
-  await fs.writeJson(historyFile, current, { spaces: 2 });
+  await withHistoryWriteLock(historyFile, async () => {
+    const current = await readTaskHistory(tasksDir, taskId);
+    current.history.push(entry);
+    await writeJsonAtomic(historyFile, current);
+    invalidateCachedFile(historyFile);
+  });
 }
 
 async function updateHistoryEntry(tasksDir, taskId, runId, updates) {
   const historyFile = path.join(tasksDir, `${taskId}-history.json`);
-  const current = await readTaskHistory(tasksDir, taskId);
-  const idx = current.history.findIndex(h => h.id === runId);
-  if (idx < 0) return;
-  current.history[idx] = { ...current.history[idx], ...updates };
-  await fs.writeJson(historyFile, current, { spaces: 2 });
+  await withHistoryWriteLock(historyFile, async () => {
+    const current = await readTaskHistory(tasksDir, taskId);
+    const idx = current.history.findIndex(h => h.id === runId);
+    if (idx < 0) return;
+    current.history[idx] = { ...current.history[idx], ...updates };
+    await writeJsonAtomic(historyFile, current);
+    invalidateCachedFile(historyFile);
+  });
 }
 
-async function listTaskLogFiles(projectPath, taskId) {
+async function readLogsDir(projectPath) {
   const logsDir = getTaskLogsDir(projectPath);
   if (!await fs.pathExists(logsDir)) return [];
+  return await fs.readdir(logsDir);
+}
 
-  const files = await fs.readdir(logsDir);
+// Parses `<taskId>-<stage>-<timestamp>.log`; stage and timestamp are null
+// when the name does not follow that layout.
+function parseTaskLogFileName(file, prefix) {
+  const rest = file.slice(prefix.length, -'.log'.length);
+  const separator = rest.lastIndexOf('-');
+  const timestamp = rest.slice(separator + 1);
+  if (separator < 1 || !DIGITS_RE.test(timestamp)) {
+    return { file, stage: null, timestamp: null };
+  }
+  return { file, stage: rest.slice(0, separator), timestamp: Number(timestamp) };
+}
+
+function filterTaskLogFiles(files, taskId) {
   const prefix = `${taskId}-`;
-  const escapedTaskId = String(taskId).replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-  const logPattern = new RegExp('^' + escapedTaskId + '-(.+?)-(\\d+)\\.log$');
   return files
     .filter(f => f.startsWith(prefix) && f.endsWith('.log'))
-    .map(file => {
-      const match = file.match(logPattern);
-      return {
-        file,
-        stage: match ? match[1] : null,
-        timestamp: match ? Number(match[2]) : null
-      };
-    })
+    .map(file => parseTaskLogFileName(file, prefix))
     .sort((a, b) => (a.timestamp || 0) - (b.timestamp || 0));
 }
 
+async function listTaskLogFiles(projectPath, taskId) {
+  return filterTaskLogFiles(await readLogsDir(projectPath), taskId);
+}
+
 async function readLogFile(projectPath, logFile, maxBytes = 1024 * 1024) {
   const safeName = path.basename(logFile);
   if (safeName !== logFile) {
@@ -381,13 +440,14 @@ app.get('/api/projects', async (req, res) => {
     for (const file of files) {
       if (file.endsWith('.json')) {
         try {
-          const content = await fs.readJson(path.join(SETTINGS_DIR, file));
+          const content = await readJsonCached(path.join(SETTINGS_DIR, file));
           const projectPath = content.path;
 
           const isAccessible = await fs.pathExists(projectPath);
+          const projectId = file.slice(0, -'.json'.length);
 	          const project = {
-	            id: file.replace('.json', ''),
-	            name: content.name || file.replace('.json', ''),
+	            id: projectId,
+	            name: content.name || projectId,
 	            path: projectPath,
 	            worktreePrefix: content.worktreePrefix || 'task-',
 	            defaultModel: withFullName(content.defaultModel || null),
@@ -417,15 +477,21 @@ app.get('/api/projects/:projectId/tasks', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const config = await readJsonCached(configPath);
     const tasksPath = path.join(config.path, '.memory_bank/tasks');
 
     if (!await fs.pathExists(tasksPath)) {
       return res.json([]);
     }
 
-    const files = await fs.readdir(tasksPath);
-    const tasks = [];
+    // An unreadable logs directory should not hide the tasks themselves.
+    const [files, logFiles] = await Promise.all([
+      fs.readdir(tasksPath),
+      readLogsDir(config.path).catch(err => {
+        console.error('Error reading task logs directory:', err);
+        return [];
+      })
+    ]);
 
     const defaultModel = config.defaultModel || {
       agenticHarness: 'opencode',
@@ -433,39 +499,41 @@ app.get('/api/projects/:projectId/tasks', async (req, res) => {
       modelName: 'claude-sonnet-4-5'
     };
 
-    for (const file of files) {
-      if (file.endsWith('.md')) {
-        try {
-          const fullPath = path.join(tasksPath, file);
-          const content = await fs.readFile(fullPath, 'utf-8');
-	          const taskId = file.replace('.md', '');
-	          const frontmatter = parseFrontmatter(content);
-	          const { title = taskId, status = 'New', priority = 'Medium' } = frontmatter;
-	          const modelProvider = frontmatter.modelProvider || defaultModel.modelProvider;
-	          const modelName = frontmatter.modelName || defaultModel.modelName;
-	          const history = await readTaskHistory(tasksPath, taskId);
-
-	          tasks.push({
-	            id: taskId,
-	            title,
-	            status,
-	            priority,
-	            stage: frontmatter.stage || 'Specification',
-	            startedAt: frontmatter.startedAt || null,
-	            model: withFullName({
-	              agenticHarness: frontmatter.agenticHarness || defaultModel.agenticHarness,
-	              modelProvider,
-	              modelName
-	            }),
-	            history: history.history,
-	            executions: history.history,
-	            logs: await listTaskLogFiles(config.path, taskId)
-	          });
-	        } catch (err) {
-	          console.error(`Error reading task ${file}:`, err);
-	        }
+    const taskFiles = files.filter(file => file.endsWith('.md'));
+    const results = await Promise.all(taskFiles.map(async (file) => {
+      try {
+        const fullPath = path.join(tasksPath, file);
+        const taskId = file.slice(0, -'.md'.length);
+        const [frontmatter, history] = await Promise.all([
+          readFileCached(fullPath, parseFrontmatter),
+          readTaskHistory(tasksPath, taskId, { cached: true })
+        ]);
+        const { title = taskId, status = 'New', priority = 'Medium' } = frontmatter;
+        const modelProvider = frontmatter.modelProvider || defaultModel.modelProvider;
+        const modelName = frontmatter.modelName || defaultModel.modelName;
+
+        return {
+          id: taskId,
+          title,
+          status,
+          priority,
+          stage: frontmatter.stage || 'Specification',
+          startedAt: frontmatter.startedAt || null,
+          model: withFullName({
+            agenticHarness: frontmatter.agenticHarness || defaultModel.agenticHarness,
+            modelProvider,
+            modelName
+          }),
+          history: history.history,
+          executions: history.history,
+          logs: filterTaskLogFiles(logFiles, taskId)
+        };
+      } catch (err) {
+        console.error(`Error reading task ${file}:`, err);
+        return null;
       }
-    }
+    }));
+    const tasks = results.filter(Boolean);
 
     res.json(tasks);
   } catch (err) {
@@ -517,7 +585,7 @@ app.post('/api/projects', async (req, res) => {
       }
     }
 
-    const projectId = name.toLowerCase().replace(/\s+/g, '-');
+    const projectId = name.toLowerCase().replace(PROJECT_ID_WHITESPACE_RE, '-');
     const configPath = path.join(SETTINGS_DIR, `${projectId}.json`);
 
     if (await fs.pathExists(configPath)) {
@@ -536,6 +604,7 @@ app.post('/api/projects', async (req, res) => {
     }
 
     await fs.writeJson(configPath, projectConfig, { spaces: 2 });
+    invalidateCachedFile(configPath);
 
 	    res.json({
 	      id: projectId,
@@ -560,7 +629,8 @@ app.put('/api/projects/:id', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const storedConfig = await readJsonCached(configPath);
+    const config = { ...storedConfig };
 
     const hasDefaultModelField = Object.prototype.hasOwnProperty.call(req.body, 'defaultModel');
     if (defaultModel && typeof defaultModel === 'object') {
@@ -611,7 +681,10 @@ app.put('/api/projects/:id', async (req, res) => {
       }
     }
 
-    await fs.writeJson(configPath, config, { spaces: 2 });
+    if (JSON.stringify(config) !== JSON.stringify(storedConfig)) {
+      await fs.writeJson(configPath, config, { spaces: 2 });
+      invalidateCachedFile(configPath);
+    }
 
     res.json({
       id: req.params.id,
@@ -639,9 +712,9 @@ app.get('/api/tasks/:id/history', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const config = await readJsonCached(configPath);
     const tasksPath = path.join(config.path, '.memory_bank/tasks');
-    const history = await readTaskHistory(tasksPath, req.params.id);
+    const history = await readTaskHistory(tasksPath, req.params.id, { cached: true });
     res.json(history);
   } catch (error) {
     console.error('Error getting task history:', error);
@@ -657,7 +730,7 @@ app.get('/api/projects/:projectId/tasks/:taskId/logs', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const config = await readJsonCached(configPath);
     const logs = await listTaskLogFiles(config.path, taskId);
     res.json({ logs });
   } catch (error) {
@@ -674,7 +747,7 @@ app.get('/api/projects/:projectId/logs/:logFile', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const config = await readJsonCached(configPath);
     const content = await readLogFile(config.path, logFile);
     res.type('text/plain').send(content);
   } catch (error) {
@@ -692,7 +765,7 @@ app.put('/api/tasks/:taskId/model', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const config = await readJsonCached(configPath);
     const tasksPath = path.join(config.path, '.memory_bank/tasks');
     const taskFile = path.join(tasksPath, `${req.params.taskId}.md`);
 
@@ -742,7 +815,7 @@ app.post('/api/tasks/:taskId/run', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const config = await readJsonCached(configPath);
     const tasksPath = path.join(config.path, '.memory_bank/tasks');
     const taskFile = path.join(tasksPath, `${req.params.taskId}.md`);
 
@@ -915,7 +988,7 @@ app.post('/api/tasks/:id/next-stage', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const config = await readJsonCached(configPath);
     const tasksPath = path.join(config.path, '.memory_bank/tasks');
     const taskFile = path.join(tasksPath, `${req.params.id}.md`);
 
@@ -959,7 +1032,7 @@ app.post('/api/tasks/:id/stop', async (req, res) => {
       return res.status(404).json({ error: 'Project not found' });
     }
 
-    const config = await fs.readJson(configPath);
+    const config = await readJsonCached(configPath);
     const tasksPath = path.join(config.path, '.memory_bank/tasks');
     const taskFile = path.join(tasksPath, `${req.params.id}.md`);
 
@@ -1026,7 +1099,7 @@ app.get('*', (req, res) => {
 })();
 
 function parseFrontmatter(content) {
-  const frontmatterMatch = content.match(/^---\n([\s\S]*?)\n---/);
+  const frontmatterMatch = content.match(FRONTMATTER_RE);
   if (!frontmatterMatch) {
     return { stage: 'Specification', status: 'New' };
   }
@@ -1036,10 +1109,11 @@ function parseFrontmatter(content) {
   const result = {};
 
   for (const line of lines) {
-    const [key, ...valueParts] = line.split(':');
-    if (key && valueParts.length > 0) {
-      const value = valueParts.join(':').trim();
-      result[key.trim()] = value.replace(/^"|"$/g, '');
+    const separator = line.indexOf(':');
+    if (separator > 0) {
+      const key = line.slice(0, separator);
+      const value = line.slice(separator + 1).trim();
+      result[key.trim()] = value.replace(SURROUNDING_QUOTES_RE, '');
     }
   }
 
@@ -1055,7 +1129,7 @@ function parseFrontmatter(content) {
 }
 
 function updateFrontmatter(content, updates) {
-  const frontmatterMatch = content.match(/^---\n([\s\S]*?)\n---/);
+  const frontmatterMatch = content.match(FRONTMATTER_RE);
   
   if (frontmatterMatch) {
     let frontmatter = frontmatterMatch[1];
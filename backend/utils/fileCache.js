@@ -0,0 +1,64 @@
+const fs = require('fs-extra');
+
+// Entries are dropped once their file is gone or has not been read for
+// CACHE_IDLE_TTL, never by count: a tasks listing re-reads every task and
+// history file on each poll, so a size bound would evict its own entries.
+const CACHE_IDLE_TTL = 10 * 60 * 1000;
+const CACHE_SWEEP_INTERVAL = 60 * 1000;
+const FILE_CACHE = new Map();
+let lastSweepAt = 0;
+
+function sweepIdleEntries(now) {
+  if (now - lastSweepAt < CACHE_SWEEP_INTERVAL) return;
+  lastSweepAt = now;
+  for (const [filePath, entry] of FILE_CACHE) {
+    if (now - entry.lastUsedAt > CACHE_IDLE_TTL) {
+      FILE_CACHE.delete(filePath);
+    }
+  }
+}
+
+// Returned values are shared between callers: treat them as read-only.
+async function readFileCached(filePath, parse) {
+  let stat;
+  try {
+    stat = await fs.stat(filePath);
+  } catch (error) {
+    FILE_CACHE.delete(filePath);
+    throw error;
+  }
+
+  const now = Date.now();
+  sweepIdleEntries(now);
+
+  const cached = FILE_CACHE.get(filePath);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    cached.lastUsedAt = now;
+    return cached.value;
+  }
+
+  const content = await fs.readFile(filePath, 'utf-8');
+  const value = parse(content);
+  FILE_CACHE.set(filePath, { mtimeMs: stat.mtimeMs, size: stat.size, lastUsedAt: now, value });
+  return value;
+}
+
+// Strips a leading UTF-8 BOM like fs-extra's readJson does, so configs
+// saved by editors that add one keep parsing.
+function parseJson(content) {
+  return JSON.parse(content.replace(/^\uFEFF/, ''));
+}
+
+async function readJsonCached(filePath) {
+  return readFileCached(filePath, parseJson);
+}
+
+function invalidateCachedFile(filePath) {
+  FILE_CACHE.delete(filePath);
+}
+
+module.exports = {
+  readFileCached,
+  readJsonCached,
+  invalidateCachedFile
+};
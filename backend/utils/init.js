@@ -1,3 +1,4 @@
+const path = require('path');
 const fs = require('fs-extra');
 const {
   getSettingsDir,
@@ -122,14 +123,14 @@ async function initNcrewStructure() {
 
   const templatesDir = getTemplatesDir();
   for (const [fileName, content] of Object.entries(DEFAULT_TEMPLATES)) {
-    const filePath = require('path').join(templatesDir, fileName);
+    const filePath = path.join(templatesDir, fileName);
     await ensureFileIfMissing(filePath, content);
     console.log(`  Ensured template: ${filePath}`);
   }
 
   const promptsDir = getStagePromptsDir();
   for (const [fileName, content] of Object.entries(DEFAULT_STAGE_PROMPTS)) {
-    const filePath = require('path').join(promptsDir, fileName);
+    const filePath = path.join(promptsDir, fileName);
     await ensureFileIfMissing(filePath, content);
     console.log(`  Ensured stage prompt: ${filePath}`);
   }
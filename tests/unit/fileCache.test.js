@@ -0,0 +1,57 @@
+const test = require('node:test');
+const assert = require('node:assert');
+const os = require('os');
+const path = require('path');
+const fs = require('fs');
+
+const { readFileCached } = require('../../backend/utils/fileCache');
+
+function makeTempDir() {
+  return fs.mkdtempSync(path.join(os.tmpdir(), 'ncrew-file-cache-'));
+}
+
+async function readAll(files, parse) {
+  return Promise.all(files.map(file => readFileCached(file, parse)));
+}
+
+test('second listing of an unchanged project does not re-parse', async () => {
+  const dir = makeTempDir();
+  // More files than any count-based bound would hold, read in the same
+  // order on each pass like the tasks listing does.
+  const files = [];
+  for (let i = 0; i < 1200; i++) {
+    const file = path.join(dir, `task-${i}.md`);
+    fs.writeFileSync(file, `---\ntitle: Task ${i}\n---\n`);
+    files.push(file);
+  }
+
+  let parses = 0;
+  const parse = (content) => {
+    parses += 1;
+    return content;
+  };
+
+  await readAll(files, parse);
+  assert.strictEqual(parses, files.length);
+
+  parses = 0;
+  await readAll(files, parse);
+  assert.strictEqual(parses, 0);
+});
+
+test('a changed file is re-parsed', async () => {
+  const dir = makeTempDir();
+  const file = path.join(dir, 'task.md');
+  fs.writeFileSync(file, 'a');
+
+  let parses = 0;
+  const parse = (content) => {
+    parses += 1;
+    return content;
+  };
+
+  assert.strictEqual(await readFileCached(file, parse), 'a');
+  fs.writeFileSync(file, 'bb');
+  assert.strictEqual(await readFileCached(file, parse), 'bb');
+  assert.strictEqual(parses, 2);
+});